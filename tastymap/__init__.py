@@ -1,13 +1,53 @@
 """Color palettes for your palate"""
 
-from .core import cook_tmap, pair_tbar
-from .models import TastyBar, TastyMap
+from __future__ import annotations
 
-try:
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import cook_tmap, pair_tbar
+    from .models import TastyBar, TastyMap
     from .ui import TastyKitchen
-except ImportError:
-    pass
 
 __version__ = "0.4.1"
 
 __all__ = ["cook_tmap", "pair_tbar", "TastyMap", "TastyBar", "TastyKitchen"]
+
+# matplotlib is slow to import, so defer it until an attribute is accessed
+_LAZY_IMPORTS = {
+    "cook_tmap": ".core",
+    "pair_tbar": ".core",
+    "TastyMap": ".models",
+    "TastyBar": ".models",
+    "TastyKitchen": ".ui",
+}
+
+# submodules reachable as attributes without importing them explicitly
+_SUBMODULES = {"core", "models", "utils", "ui"}
+
+# submodules that need extras, whose attributes are simply absent without them
+_OPTIONAL_MODULES = {".ui"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        module_name = f".{name}"
+    elif name in _LAZY_IMPORTS:
+        module_name = _LAZY_IMPORTS[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = import_module(module_name, __name__)
+    except ImportError as exc:
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        raise AttributeError(f"{name!r} is unavailable; {exc}") from exc
+    attr = module if name in _SUBMODULES else getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
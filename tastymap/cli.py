@@ -1,7 +1,5 @@
 import argparse
 
-from .ui import TastyKitchen
-
 
 def main():
     parser = argparse.ArgumentParser(description="Serve the TastyKitchen UI")
@@ -9,6 +7,8 @@ def main():
     args = parser.parse_args()
 
     if args.command == "ui":
+        from .ui import TastyKitchen
+
         TastyKitchen().serve(port=8888, show=True)
 
 
@@ -54,7 +54,11 @@ def cook_tmap(
                 "between RGB and HSV color models."
             )
         if len(colors_or_cmap) == 1:
-            colors_or_cmap = list(colors_or_cmap) * 2
+            # a colormap needs two colors; arrays stay arrays
+            if isinstance(colors_or_cmap, np.ndarray):
+                colors_or_cmap = np.repeat(colors_or_cmap, 2, axis=0)
+            else:
+                colors_or_cmap = [colors_or_cmap[0]] * 2
         tmap = TastyMap.from_list(
             colors_or_cmap, color_model=from_color_model or ColorModel.RGB
         )
@@ -70,7 +74,7 @@ def cook_tmap(
     if hue or saturation or value:
         tmap = tmap.tweak_hsv(hue=hue, saturation=saturation, value=value)
 
-    if num_colors:
+    if num_colors and num_colors != len(tmap):
         tmap = tmap.resize(num_colors)
 
     if reverse:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from enum import Enum
+from functools import cached_property
 from typing import Any, Literal
 
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import colormaps
+from matplotlib.artist import Artist
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import (
     BoundaryNorm,
@@ -16,12 +17,20 @@ from matplotlib.colors import (
     ListedColormap,
     Normalize,
     hsv_to_rgb,
-    rgb2hex,
-    rgb_to_hsv,
 )
 from matplotlib.ticker import FuncFormatter
 
-from .utils import cmap_to_array, get_cmap, subset_cmap
+from .utils import (
+    array_to_cmap,
+    cmap_to_array,
+    get_cmap,
+    resample_array,
+    rgb_to_hsv,
+    subset_array,
+    tweak_hsv_to_rgb,
+)
+
+_HEX_LUT = np.array([f"{i:02x}" for i in range(256)], dtype="<U2")
 
 
 class ColorModel(Enum):
@@ -40,19 +49,36 @@ class ColorModel(Enum):
     HEX = "hex"
 
 
+# color models by member and by value
+_COLOR_MODELS: dict[ColorModel | str, ColorModel] = {
+    model: model for model in ColorModel
+}
+_COLOR_MODELS.update({model.value: model for model in ColorModel})
+
+
+def _parse_color_model(color_model: ColorModel | str) -> ColorModel:
+    """Looks up a color model, matching strings case-insensitively."""
+    model = _COLOR_MODELS.get(color_model)
+    if model is None and isinstance(color_model, str):
+        model = _COLOR_MODELS.get(color_model.lower())
+    if model is None:
+        raise ValueError(
+            f"Invalid color model: {color_model!r}; "
+            f"select from: {[cm.value for cm in ColorModel]}."
+        )
+    return model
+
+
 class TastyMap:
     """A class to represent and manipulate colormaps in a tasty manner.
 
     Attributes:
         cmap: The colormap object.
-        cmap_array: RGB array representation of the colormap.
+        cmap_array: RGBA array representation of the colormap.
+        hsv_array: HSV array representation of the colormap.
     """
 
-    def __init__(
-        self,
-        cmap: Colormap,
-        name: str | None = None,
-    ):
+    def __init__(self, cmap: Colormap, name: str | None = None):
         """Initializes a TastyMap instance.
 
         Args:
@@ -67,7 +93,37 @@ class TastyMap:
         cmap = cmap.copy()
         cmap.name = name or cmap.name
         self.cmap: Colormap = cmap
-        self._cmap_array = cmap_to_array(cmap)
+        self._n = cmap.N
+
+    @classmethod
+    def _from_cmap(
+        cls,
+        cmap: Colormap,
+        cmap_array: np.ndarray | None = None,
+        hsv_array: np.ndarray | None = None,
+    ) -> TastyMap:
+        """Creates a TastyMap instance that owns a freshly built colormap.
+
+        Args:
+            cmap: A colormap no one else holds, so it is not copied.
+            cmap_array: The RGBA colors the colormap looks up, if already known.
+            hsv_array: The same colors in HSV, if already known.
+
+        Returns:
+            TastyMap: A new TastyMap instance.
+        """
+        tmap = cls.__new__(cls)
+        tmap.cmap = cmap
+        tmap._n = cmap.N
+        # fill in the cached properties that would otherwise be computed,
+        # read-only like the computed ones
+        if cmap_array is not None:
+            cmap_array.flags.writeable = False
+            tmap._cmap_array = cmap_array
+        if hsv_array is not None:
+            hsv_array.flags.writeable = False
+            tmap._hsv_array = hsv_array
+        return tmap
 
     @classmethod
     def from_str(cls, string: str) -> TastyMap:
@@ -80,13 +136,20 @@ class TastyMap:
             TastyMap: A new TastyMap instance.
         """
         cmap = get_cmap(string)  # type: ignore
-        cmap_array = cmap_to_array(cmap)
-
-        new_name = string
-        cmap = LinearSegmentedColormap.from_list(
-            new_name, cmap_array, N=len(cmap_array)
+        # the registry already hands out a copy, so it is safe to own
+        if isinstance(cmap, LinearSegmentedColormap) and cmap.name == string:
+            return cls._from_cmap(cmap)
+
+        # indexing returns the RGBA colors of the lookup table as they are
+        cmap_array = cmap(np.arange(cmap.N))
+
+        # keeping the registered extremes, as the colormap above does
+        new_cmap = array_to_cmap(string, cmap_array).with_extremes(
+            bad=cmap.get_bad(),  # type: ignore
+            under=cmap.get_under(),  # type: ignore
+            over=cmap.get_over(),  # type: ignore
         )
-        return TastyMap(cmap, name=new_name)
+        return cls._from_cmap(new_cmap, cmap_array=resample_array(cmap_array, cmap.N))
 
     @classmethod
     def from_list(
@@ -110,11 +173,10 @@ class TastyMap:
             raise ValueError("Must provide at least one color.")
         cmap_array = cmap_to_array(colors)
 
-        if color_model in (ColorModel.HSV, ColorModel.HSV.value):
+        if _parse_color_model(color_model) is ColorModel.HSV:
             cmap_array = hsv_to_rgb(cmap_array)
 
-        cmap = LinearSegmentedColormap.from_list(name, cmap_array, N=len(cmap_array))
-        return TastyMap(cmap)
+        return cls._from_cmap(array_to_cmap(name, cmap_array))
 
     @classmethod
     def from_listed_colormap(
@@ -133,15 +195,62 @@ class TastyMap:
         """
         return cls.from_list(listed_colormap.colors, name=name)  # type: ignore
 
-    def _from_list_with_extremes(self, *args, **kwargs) -> LinearSegmentedColormap:
-        """Creates a TastyMap instance from a list of colors with extreme values."""
-        cmap = LinearSegmentedColormap.from_list(*args, **kwargs)
-        cmap.set_extremes(
-            bad=self.cmap.get_bad(),  # type: ignore
-            under=self.cmap.get_under(),  # type: ignore
-            over=self.cmap.get_over(),  # type: ignore
+    def _derive(
+        self,
+        name: str,
+        cmap_array: np.ndarray,
+        N: int,
+        hsv_array: np.ndarray | None = None,
+    ) -> TastyMap:
+        """Creates a TastyMap instance from new colors, keeping the extreme values."""
+        resampled = resample_array(cmap_array, N)
+        if hsv_array is not None and not np.array_equal(resampled, cmap_array):
+            # the lookup table can round the colors, leaving the HSV ones stale
+            hsv_array = None
+        # read the extremes as they are now, since the colormap is mutable
+        return self._from_cmap(
+            array_to_cmap(name, cmap_array, N).with_extremes(
+                bad=self.cmap.get_bad(),  # type: ignore
+                under=self.cmap.get_under(),  # type: ignore
+                over=self.cmap.get_over(),  # type: ignore
+            ),
+            cmap_array=resampled,
+            hsv_array=hsv_array,
         )
-        return cmap
+
+    @cached_property
+    def _cmap_array(self) -> np.ndarray:
+        # sampled on first use, since renaming and registering only pass the
+        # colormap along
+        cmap_array = cmap_to_array(self.cmap)
+        cmap_array.flags.writeable = False
+        return cmap_array
+
+    @property
+    def cmap_array(self) -> np.ndarray:
+        """RGBA array representation of the colormap, cached and read-only."""
+        return self._cmap_array
+
+    @cached_property
+    def _hsv_array(self) -> np.ndarray:
+        hsv_array = rgb_to_hsv(self._cmap_array[:, :3])
+        hsv_array.flags.writeable = False
+        return hsv_array
+
+    @cached_property
+    def _hex_array(self) -> np.ndarray:
+        rgb = np.rint(self._cmap_array[:, :3] * 255).astype(np.uint8)
+        hex_array = np.char.add(
+            np.char.add(np.char.add("#", _HEX_LUT[rgb[:, 0]]), _HEX_LUT[rgb[:, 1]]),
+            _HEX_LUT[rgb[:, 2]],
+        )
+        hex_array.flags.writeable = False
+        return hex_array
+
+    @property
+    def hsv_array(self) -> np.ndarray:
+        """HSV array representation of the colormap, computed once and cached."""
+        return self._hsv_array
 
     def resize(self, num_colors: int) -> TastyMap:
         """Resizes the colormap to a specified number of colors.
@@ -150,12 +259,12 @@ class TastyMap:
             num_colors: Number of colors to resize to.
 
         Returns:
-            TastyMap: A new TastyMap instance with the interpolated colormap.
+            TastyMap: A new TastyMap instance with the interpolated colormap,
+                or the same instance if it already has `num_colors` colors.
         """
-        cmap = self._from_list_with_extremes(
-            self.cmap.name, self._cmap_array, N=num_colors
-        )
-        return TastyMap(cmap)
+        if num_colors == self._n:
+            return self
+        return self._derive(self.cmap.name, self._cmap_array, N=num_colors)
 
     def register(self, name: str | None = None, echo: bool = True) -> TastyMap:
         """Registers the colormap with matplotlib.
@@ -199,27 +308,22 @@ class TastyMap:
 
         Returns:
             np.ndarray: Array representation of the colormap
-                in the specified color model.
+                in the specified color model; the arrays are cached
+                and read-only, so copy them before modifying.
         """
-        if isinstance(color_model, str):
-            try:
-                color_model = ColorModel(color_model.lower())
-            except ValueError:
-                raise ValueError(
-                    f"Invalid color model: {color_model!r}; "
-                    f"select from: {[cm.value for cm in ColorModel]}."
-                )
+        return _CONVERTERS[_parse_color_model(color_model)](self)
 
-        if color_model == ColorModel.RGBA:
-            return self._cmap_array
-        elif color_model == ColorModel.RGB:
-            return self._cmap_array[:, :3]
-        elif color_model == ColorModel.HSV:
-            return rgb_to_hsv(self._cmap_array[:, :3])
-        elif color_model == ColorModel.HEX:
-            return np.apply_along_axis(
-                rgb2hex, 1, self._cmap_array[:, :3]  # type: ignore
-            )
+    def _to_rgba(self) -> np.ndarray:
+        return self._cmap_array
+
+    def _to_rgb(self) -> np.ndarray:
+        return self._cmap_array[:, :3]
+
+    def _to_hsv(self) -> np.ndarray:
+        return self.hsv_array
+
+    def _to_hex(self) -> np.ndarray:
+        return self._hex_array
 
     def set_extremes(
         self,
@@ -237,9 +341,9 @@ class TastyMap:
         Returns:
             TastyMap: A new TastyMap instance with the updated colormap.
         """
-        cmap = self.cmap.copy()
-        cmap.set_extremes(bad=bad, under=under, over=over)  # type: ignore
-        return TastyMap(cmap)
+        cmap = self.cmap.with_extremes(bad=bad, under=under, over=over)
+        # the extremes sit outside the colors, so any sampled colors still hold
+        return self._from_cmap(cmap, cmap_array=vars(self).get("_cmap_array"))
 
     def tweak_hsv(
         self,
@@ -259,34 +363,40 @@ class TastyMap:
         Returns:
             TastyMap: A new TastyMap instance with the tweaked colormap.
         """
-        cmap_array = self._cmap_array.copy()
-        cmap_array[:, :3] = rgb_to_hsv(cmap_array[:, :3])
         if hue is not None:
             hue /= 255
             if abs(hue) > 1:
                 raise ValueError("Hue must be between -255 and 255 (non-inclusive).")
-            cmap_array[:, 0] = (cmap_array[:, 0] + hue) % 1
         if saturation is not None:
             if abs(saturation) > 10:
                 raise ValueError("Saturation must be between -10 and 10.")
-            cmap_array[:, 1] = cmap_array[:, 1] * saturation
         if value is not None:
             if value < 0 or value > 3:
                 raise ValueError("Value must be between 0 and 3.")
-            cmap_array[:, 2] = cmap_array[:, 2] * value
-        cmap_array[:, :3] = hsv_to_rgb(np.clip(cmap_array[:, :3], 0, 1))
-        cmap = self._from_list_with_extremes(
-            name or self.cmap.name, cmap_array, N=len(cmap_array)
+
+        cmap_array = np.empty_like(self._cmap_array)
+        cmap_array[:, 3] = self._cmap_array[:, 3]
+        hsv_array = np.empty_like(self.hsv_array)
+        tweak_hsv_to_rgb(
+            self.hsv_array,
+            hue=hue or 0,
+            saturation=1 if saturation is None else saturation,
+            value=1 if value is None else value,
+            out=cmap_array[:, :3],
+            hsv_out=hsv_array,
+        )
+        # pass the HSV colors along so chained tweaks skip converting back from RGB
+        return self._derive(
+            name or self.cmap.name, cmap_array, N=len(cmap_array), hsv_array=hsv_array
         )
-        return TastyMap(cmap)
 
-    def __iter__(self) -> Generator[np.ndarray, None, None]:
+    def __iter__(self) -> Iterator[np.ndarray]:
         """Iterates over the colormap.
 
-        Yields:
-            np.ndarray: An array of colors.
+        Returns:
+            Iterator[np.ndarray]: An iterator over row views of the colors.
         """
-        yield from self._cmap_array
+        return iter(self._cmap_array)
 
     def __getitem__(self, indices: int | float | slice | Sequence) -> TastyMap:
         """Gets a subset of the colormap.
@@ -297,8 +407,11 @@ class TastyMap:
         Returns:
             TastyMap: A new TastyMap instance with the subset colormap.
         """
-        cmap = subset_cmap(self.cmap, indices)
-        return TastyMap(cmap)
+        cmap_array, name = subset_array(self._cmap_array, indices, self.cmap.name)
+        return self._from_cmap(
+            array_to_cmap(name, cmap_array),
+            cmap_array=resample_array(cmap_array, len(cmap_array)),
+        )
 
     def _repr_html_(self) -> str:
         """Returns an HTML representation of the colormap.
@@ -390,9 +503,11 @@ class TastyMap:
                 f"Can only combine TastyMap instances; received {type(tmap)!r}."
             )
         name = self.cmap.name + "_" + tmap.cmap.name
-        cmap_array = np.concatenate([self._cmap_array, cmap_to_array(tmap.cmap)])
-        cmap = self._from_list_with_extremes(name, cmap_array, N=len(cmap_array))
-        return TastyMap(cmap)
+        num_colors = self._n + tmap._n
+        cmap_array = np.empty((num_colors, 4), dtype=self._cmap_array.dtype)
+        cmap_array[: self._n] = self._cmap_array
+        cmap_array[self._n :] = tmap._cmap_array
+        return self._derive(name, cmap_array, N=num_colors)
 
     def __or__(self, num_colors: int) -> TastyMap:
         """Interpolates the colormap to a specified number of colors.
@@ -445,7 +560,7 @@ class TastyMap:
         Returns:
             int: Number of colors in the colormap.
         """
-        return len(self._cmap_array)
+        return self._n
 
     def __eq__(self, other: Any) -> bool:
         """Checks if two TastyMap instances are equal.
@@ -458,8 +573,12 @@ class TastyMap:
         """
         if not isinstance(other, TastyMap):
             return False
-        cmap_array = other._cmap_array
-        return bool(np.all(self._cmap_array == cmap_array))
+        cmap_array, other_cmap_array = self._cmap_array, other._cmap_array
+        if cmap_array is other_cmap_array:
+            return True
+        if cmap_array.shape != other_cmap_array.shape:
+            return False
+        return bool(np.array_equal(cmap_array, other_cmap_array))
 
     def __str__(self) -> str:
         """Returns the name of the colormap.
@@ -478,6 +597,21 @@ class TastyMap:
         return f"TastyMap({self.cmap.name!r})"
 
 
+# TastyMap.to_model converters, by color model
+_CONVERTERS: dict[ColorModel, Callable[[TastyMap], np.ndarray]] = {
+    ColorModel.RGBA: TastyMap._to_rgba,
+    ColorModel.RGB: TastyMap._to_rgb,
+    ColorModel.HSV: TastyMap._to_hsv,
+    ColorModel.HEX: TastyMap._to_hex,
+}
+
+
+def _step_ticks(vmin: float, vmax: float, step: float) -> np.ndarray:
+    """Steps from vmin until vmax is covered, without round-off stray ticks."""
+    num_steps = int(np.ceil((vmax - vmin) / step - 1e-9))
+    return vmin + step * np.arange(num_steps + 1)
+
+
 class TastyBar(ABC):
     def __init__(
         self,
@@ -541,10 +675,11 @@ class MatplotlibTastyBar(TastyBar):
                 num_ticks = min(num_colors - 1, 11)
                 ticks = np.linspace(vmin, vmax, num_ticks)
             else:
-                ticks = np.arange(vmin, vmax + step, step)
+                ticks = _step_ticks(vmin, vmax, step)
         else:
             ticks = np.array(self.bounds)
-            ticks.sort()
+            if (np.diff(ticks) < 0).any():
+                ticks.sort()
             vmin, vmax = ticks[0], ticks[-1]
 
         if center is None and not is_slice:
@@ -559,8 +694,9 @@ class MatplotlibTastyBar(TastyBar):
             if is_slice:
                 ticks = None  # let matplotlib decide
         elif center:
-            norm_bins = ticks + 0.5
-            norm_bins = np.insert(norm_bins, 0, norm_bins[0] - 1)
+            norm_bins = np.empty(len(ticks) + 1)
+            norm_bins[1:] = ticks + 0.5
+            norm_bins[0] = norm_bins[1] - 1
             norm = BoundaryNorm(norm_bins, num_colors, clip=clip, extend=self.extend)
             if labels is None:
                 labels = ticks.copy()
@@ -570,10 +706,11 @@ class MatplotlibTastyBar(TastyBar):
 
         format = None
         if labels is not None:
+            # called once per tick, so bind the labels and their count up front
+            tick_labels = tuple(labels)
+            num_labels = len(tick_labels)
             format = FuncFormatter(
-                lambda _, index: labels[index]  # type: ignore
-                if index < len(labels)  # type: ignore
-                else ""
+                lambda _, index: tick_labels[index] if index < num_labels else ""
             )
 
         self.norm = norm
@@ -607,7 +744,14 @@ class MatplotlibTastyBar(TastyBar):
         plot_settings = self.plot_settings
         plot.cmap = plot_settings["cmap"]
         plot.norm = plot_settings["norm"]
-        plt.colorbar(plot, **self.colorbar_settings)
+        # only artists carry axes; draw on their figure, which pyplot may not manage
+        axes = plot.axes if isinstance(plot, Artist) else None
+        if axes is None:
+            import matplotlib.pyplot as plt
+
+            plt.colorbar(plot, **self.colorbar_settings)
+        else:
+            axes.figure.colorbar(plot, **self.colorbar_settings)
         return plot
 
 
@@ -648,7 +792,7 @@ class HoloViewsTastyBar(TastyBar):
                 num_ticks = min(num_colors - 1, 11)
                 ticks = np.linspace(vmin, vmax, num_ticks)
             else:
-                ticks = np.arange(vmin, vmax + step, step)
+                ticks = _step_ticks(vmin, vmax, step)
         else:
             ticks = np.array(self.bounds)
             num_ticks = len(ticks)
@@ -658,8 +802,8 @@ class HoloViewsTastyBar(TastyBar):
         if uniform_spacing:
             if labels is None:
                 self.factors = [
-                    f"{self.ticks[i]} - {self.ticks[i + 1]}"
-                    for i in range(len(self.ticks) - 1)
+                    f"{start} - {stop}"
+                    for start, stop in zip(self.ticks[:-1], self.ticks[1:])
                 ]
             else:
                 self.factors = labels
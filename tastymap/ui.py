@@ -1,9 +1,10 @@
 import ast
+from functools import lru_cache
 from io import StringIO
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.colors import hsv_to_rgb, rgb2hex
+from matplotlib.colors import hsv_to_rgb
+from matplotlib.figure import Figure
 
 try:
     import panel as pn  # type: ignore[import]
@@ -29,6 +30,12 @@ pn.extension("jsoneditor", notifications=True)
 pn.Column.sizing_mode = "stretch_width"
 
 
+@lru_cache(maxsize=1)
+def _load_example_data():
+    """Loads the example air temperatures once per session."""
+    return xr.tutorial.open_dataset("air_temperature")["air"].isel(time=0).load()
+
+
 class TastyKitchen(pn.viewable.Viewer):
     reverse = param.Boolean(
         default=False,
@@ -143,6 +150,7 @@ class TastyKitchen(pn.viewable.Viewer):
             margin=(-20, 0, 0, 0),
         )
         self._history_box = pn.FlexBox(height=100)
+        self._last_cook_key = None
         super().__init__(**params)
 
         # cmap widgets
@@ -263,6 +271,11 @@ class TastyKitchen(pn.viewable.Viewer):
                     "sizing_mode": "stretch_width",
                     "margin": (5, 10, 5, 10),
                 },
+                # only recook once a slider is released, not on every drag step
+                "num_colors": {"throttled": True},
+                "hue": {"throttled": True},
+                "saturation": {"throttled": True},
+                "value": {"throttled": True},
                 "bad": {"placeholder": "black"},
                 "under": {"placeholder": "blue"},
                 "over": {"placeholder": "red"},
@@ -519,20 +532,27 @@ class TastyKitchen(pn.viewable.Viewer):
 
     # param methods
     def _render_colors(self, colors):
-        color_background_tuples = []
-
-        for color in colors:
-            prefix = ""
-            background_color = color
-            if isinstance(color, tuple):
-                if any(c > 1 for c in color):
-                    color = tuple(c / 255 for c in color)
-                prefix = "RGB<br>"
-                if self.from_color_model == "HSV":
-                    background_color = hsv_to_rgb(color)
-                    prefix = "HSV<br>"
-                background_color = rgb2hex(background_color)
-            color_background_tuples.append((f"{prefix}{color}", background_color))
+        labels = list(colors)
+        background_colors = list(colors)
+
+        tuple_indices = [
+            i for i, color in enumerate(colors) if isinstance(color, tuple)
+        ]
+        if tuple_indices:
+            for i in tuple_indices:
+                if any(c > 1 for c in labels[i]):
+                    labels[i] = tuple(c / 255 for c in labels[i])
+
+            # convert all the tuple colors to hex codes in one pass
+            prefix = "RGB<br>"
+            rgb = np.array([labels[i][:3] for i in tuple_indices], dtype=float)
+            if self.from_color_model == "HSV":
+                rgb = hsv_to_rgb(rgb)
+                prefix = "HSV<br>"
+            rgb = np.rint(np.clip(rgb, 0, 1) * 255).astype(int)
+            for i, (r, g, b) in zip(tuple_indices, rgb.tolist()):
+                labels[i] = f"{prefix}{labels[i]}"
+                background_colors[i] = f"#{r:02x}{g:02x}{b:02x}"
         return [
             pn.pane.HTML(
                 f"<center style='background-color: lightgrey; "
@@ -545,7 +565,7 @@ class TastyKitchen(pn.viewable.Viewer):
                 width=75,
                 margin=(5, 5, 15, 5),
             )
-            for color, background_color in color_background_tuples
+            for color, background_color in zip(labels, background_colors)
         ]
 
     @pn.depends(
@@ -572,6 +592,24 @@ class TastyKitchen(pn.viewable.Viewer):
         if not colors_or_colormap:
             return
 
+        # retriggered or redundant events would rebuild the same tmap and plot
+        cook_key = (
+            self._active_index,
+            tuple(self.colors) if self._active_index == 1 else self.cmap,
+            self.from_color_model,
+            self.num_colors,
+            self.reverse,
+            self.hue,
+            self.saturation,
+            self.value,
+            self.bad,
+            self.under,
+            self.over,
+        )
+        if cook_key == self._last_cook_key:
+            return
+        self._last_cook_key = cook_key
+
         self._tmap = cook_tmap(
             colors_or_cmap=colors_or_colormap,
             num_colors=self.num_colors,
@@ -612,8 +650,10 @@ class TastyKitchen(pn.viewable.Viewer):
 
     @pn.depends("_tmap", "bounds", "labels", "uniform_spacing", watch=True)
     def _pair_tbar(self):
-        fig, ax = plt.subplots(facecolor="whitesmoke")
-        ds = xr.tutorial.open_dataset("air_temperature")["air"].isel(time=0)
+        # a bare Figure skips pyplot's figure manager, so there is nothing to close
+        fig = Figure(facecolor="whitesmoke")
+        ax = fig.subplots()
+        ds = _load_example_data()
         self._mappable = ds.plot(ax=ax, add_colorbar=False)
         if self.bounds is None:
             ini = ds.min().round(0)
@@ -632,7 +672,6 @@ class TastyKitchen(pn.viewable.Viewer):
             uniform_spacing=self.uniform_spacing,
         )
         self._plot.object = fig
-        plt.close(fig)
 
     @pn.depends("custom_name", watch=True)
     def _update_filename(self):
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Sequence
 from difflib import get_close_matches
-from re import IGNORECASE, findall, sub
 
 import numpy as np
+from matplotlib import colormaps
 from matplotlib.colors import Colormap, LinearSegmentedColormap, ListedColormap
-from matplotlib.pyplot import colormaps
-from matplotlib.pyplot import get_cmap as _get_cmap
+
+# per hue sector, which RGB channels receive the chroma and the second
+# largest component when converting HSV to RGB
+_CHROMA_TABLE = np.array(
+    [[1, 0, 0], [0, 1, 0], [0, 1, 0], [0, 0, 1], [0, 0, 1], [1, 0, 0]], dtype=float
+)
+_X_TABLE = np.array(
+    [[0, 1, 0], [1, 0, 0], [0, 0, 1], [0, 1, 0], [1, 0, 0], [0, 0, 1]], dtype=float
+)
+# suffix of reversed colormap names, like "viridis_r"
+_REVERSED_PATTERN = re.compile(r"_r+(?=_|$)", re.IGNORECASE)
+# hue offset, in sectors, of the colors whose largest channel is red, green, blue
+_HUE_OFFSET = np.array([0, 2, 4], dtype=float)
 
 
 def get_registered_cmaps() -> dict[str, str]:
@@ -17,7 +29,7 @@ def get_registered_cmaps() -> dict[str, str]:
     Returns:
         A mapping of registered colormaps.
     """
-    return {cmap.lower(): cmap for cmap in colormaps()}
+    return {cmap.lower(): cmap for cmap in sorted(colormaps)}
 
 
 def get_cmap(cmap: str) -> Colormap:
@@ -30,9 +42,13 @@ def get_cmap(cmap: str) -> Colormap:
     Returns:
         A colormap.
     """
+    # exact names skip building the case-insensitive mapping of the registry
+    if isinstance(cmap, str) and cmap in colormaps:
+        return colormaps[cmap]
+
     lower_colormaps = get_registered_cmaps()
     try:
-        return _get_cmap(lower_colormaps[cmap.lower()])
+        return colormaps[lower_colormaps[cmap.lower()]]
     except KeyError:
         matches = get_close_matches(cmap, lower_colormaps.values(), n=5, cutoff=0.1)
         if matches:
@@ -59,8 +75,26 @@ def subset_cmap(
     Returns:
         A new colormap.
     """
-    cmap_array = cmap_to_array(cmap)
-    name = name or cmap.name
+    cmap_array, name = subset_array(cmap_to_array(cmap), indices, name or cmap.name)
+    return array_to_cmap(name, cmap_array)
+
+
+def subset_array(
+    cmap_array: np.ndarray,
+    indices: int | float | slice | Sequence,
+    name: str,
+) -> tuple[np.ndarray, str]:
+    """
+    Subset an array of colors, naming the subset like `subset_cmap`.
+
+    Args:
+        cmap_array: An array of colors.
+        indices: The indices to subset.
+        name: The name of the colormap the colors belong to.
+
+    Returns:
+        The subset of colors and the name of the new colormap.
+    """
     if isinstance(indices, (int, float)):
         cmap_indices = np.array([indices] * 2).astype(int)
         name += f"_i{indices}"
@@ -76,7 +110,7 @@ def subset_cmap(
         stop = indices.stop
         if not indices.start and not indices.stop:
             if step == -1:
-                name, r_match = replace_match(r"_r+(?=_|$)", name, "_r")
+                name, r_match = replace_match(_REVERSED_PATTERN, name, "_r")
                 if not r_match:
                     name += "_r"
             else:
@@ -85,8 +119,9 @@ def subset_cmap(
             name += f"_i{start}:{stop}:{step}"
 
     cmap_array = cmap_array[cmap_indices]
-    cmap = LinearSegmentedColormap.from_list(name, cmap_array, N=len(cmap_array))
-    return cmap
+    if len(cmap_array) == 0:
+        raise IndexError(f"No colors found at indices {indices!r}.")
+    return cmap_array.copy(), name
 
 
 def cmap_to_array(
@@ -96,7 +131,8 @@ def cmap_to_array(
     Convert a colormap to an array of colors as RGB.
 
     Args:
-        cmap: A colormap.
+        cmap: A colormap, or a sequence of colors; arrays are returned
+            without copying.
 
     Returns:
         An array of colors.
@@ -109,25 +145,203 @@ def cmap_to_array(
     elif isinstance(cmap, ListedColormap):
         cmap_array = np.array(cmap.colors)
     else:
-        cmap_array = np.array(cmap)
+        cmap_array = np.asarray(cmap)
     return cmap_array
 
 
-def replace_match(pattern: str, string: str, key: str) -> tuple[str, str]:
+def array_to_cmap(
+    name: str, cmap_array: np.ndarray, num_colors: int | None = None
+) -> LinearSegmentedColormap:
+    """
+    Create a colormap from an array of colors, like `LinearSegmentedColormap.from_list`.
+
+    RGB or RGBA float arrays within 0-1, like those sampled by `cmap_to_array`,
+    are laid out as segment data directly, skipping the color parsing of
+    `LinearSegmentedColormap.from_list`.
+
+    Args:
+        name: The name of the colormap.
+        cmap_array: An array of colors.
+        num_colors: The number of colors in the lookup table.
+            Defaults to one per color in the array.
+
+    Returns:
+        A new colormap.
+    """
+    if num_colors is None:
+        num_colors = len(cmap_array)
+    if len(cmap_array) == 1:
+        # segment data must span 0 to 1, so a single color becomes a flat segment
+        cmap_array = np.repeat(cmap_array, 2, axis=0)
+
+    if (
+        cmap_array.dtype.kind != "f"
+        or cmap_array.ndim != 2
+        or cmap_array.shape[1] not in (3, 4)
+        or not ((cmap_array >= 0) & (cmap_array <= 1)).all()
+    ):
+        # let from_list parse the colors and report the invalid ones
+        return LinearSegmentedColormap.from_list(name, cmap_array, N=num_colors)
+
+    if cmap_array.shape[1] == 3:
+        cmap_array = np.column_stack([cmap_array, np.ones(len(cmap_array))])
+
+    x = np.linspace(0, 1, len(cmap_array))
+    segmentdata = {
+        channel: np.column_stack([x, cmap_array[:, i], cmap_array[:, i]])
+        for i, channel in enumerate(("red", "green", "blue", "alpha"))
+    }
+    # matplotlib only annotates sequences of tuples, but arrays are accepted too
+    return LinearSegmentedColormap(
+        name, segmentdata, N=num_colors  # type: ignore[arg-type]
+    )
+
+
+def resample_array(cmap_array: np.ndarray, num_colors: int) -> np.ndarray:
+    """
+    Resample an array of RGBA colors to the colors a colormap built from it
+    with `array_to_cmap` or `LinearSegmentedColormap.from_list` looks up.
+
+    Args:
+        cmap_array: An array of RGBA float colors within 0-1.
+        num_colors: The number of colors to resample to.
+
+    Returns:
+        The resampled colors, bit for bit those of the colormap's lookup table.
+    """
+    if len(cmap_array) == 1:
+        cmap_array = np.repeat(cmap_array, 2, axis=0)
+    if num_colors == 1:
+        # matplotlib looks up the last color for a single level
+        return np.clip(cmap_array[-1:], 0, 1)
+
+    # the same arithmetic as matplotlib's lookup table, channels side by side
+    if num_colors == len(cmap_array):
+        # each level sits on a color, so it interpolates from its left neighbor
+        # with a distance of exactly 1
+        resampled = cmap_array.copy()
+        resampled[1:-1] = (cmap_array[1:-1] - cmap_array[:-2]) + cmap_array[:-2]
+    else:
+        x = np.linspace(0, 1, len(cmap_array)) * (num_colors - 1)
+        xind = (num_colors - 1) * np.linspace(0, 1, num_colors)
+        ind = np.searchsorted(x, xind)[1:-1]
+        distance = (xind[1:-1] - x[ind - 1]) / (x[ind] - x[ind - 1])
+        lower = cmap_array[ind - 1]
+        resampled = np.concatenate(
+            [
+                cmap_array[:1],
+                distance[:, np.newaxis] * (cmap_array[ind] - lower) + lower,
+                cmap_array[-1:],
+            ]
+        )
+    return np.clip(resampled, 0, 1, out=resampled)
+
+
+def replace_match(
+    pattern: str | re.Pattern[str], string: str, key: str
+) -> tuple[str, str]:
     """
     Find a pattern in a string and remove it.
 
     Args:
-        pattern: The pattern to find.
+        pattern: The pattern to find; strings are compiled case-insensitively.
         string: The string to search.
         key: The name of the pattern.
 
     Returns:
         The new string and the match.
     """
-    matches = findall(pattern, string, IGNORECASE)
+    if not isinstance(pattern, re.Pattern):
+        pattern = re.compile(pattern, re.IGNORECASE)
+    matches = pattern.findall(string)
     if len(matches) > 1:
         raise ValueError(f"Should only contain one {key!r} but found {matches}")
     elif len(matches) == 1:
-        string = sub(pattern, "", string, count=1, flags=IGNORECASE)
+        string = pattern.sub("", string, count=1)
     return string, matches[0] if matches else ""
+
+
+def rgb_to_hsv(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of RGB colors to HSV.
+
+    Matches matplotlib's rgb_to_hsv, but gathers the channels around the
+    largest one instead of masking the array once per channel.
+
+    Args:
+        rgb: An array of RGB colors with shape (N, 3).
+
+    Returns:
+        An array of HSV colors with shape (N, 3).
+    """
+    v = rgb.max(axis=1)
+    delta = v - rgb.min(axis=1)
+    chromatic = delta > 0
+    # like matplotlib, blue takes precedence over green over red on ties
+    largest = 2 - rgb[:, ::-1].argmax(axis=1)
+    rows = np.arange(len(rgb))
+    diff = rgb[rows, (largest + 1) % 3] - rgb[rows, (largest + 2) % 3]
+
+    hsv = np.zeros_like(rgb)
+    h, s = hsv[:, 0], hsv[:, 1]
+    np.divide(delta, v, out=s, where=v > 0)
+    np.divide(diff, delta, out=h, where=chromatic)
+    h += np.where(chromatic, _HUE_OFFSET[largest], 0)
+    h /= 6
+    h %= 1
+    hsv[:, 2] = v
+    return hsv
+
+
+def tweak_hsv_to_rgb(
+    hsv: np.ndarray,
+    hue: float = 0,
+    saturation: float = 1,
+    value: float = 1,
+    out: np.ndarray | None = None,
+    hsv_out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Tweak an array of HSV colors and convert it to RGB.
+
+    The tweaks, the clipping, and the HSV to RGB conversion are fused
+    into a single branchless pass; the channels receiving the chroma and
+    the second largest component are looked up per hue sector.
+
+    Args:
+        hsv: An array of HSV colors with shape (N, 3).
+        hue: Hue offset (-1 to 1) to shift by.
+        saturation: Saturation factor to multiply by.
+        value: Brightness value factor to multiply by.
+        out: An array with shape (N, 3) to write the RGB colors into.
+        hsv_out: An array with shape (N, 3) to write the tweaked HSV colors
+            into; like matplotlib's rgb_to_hsv, grays get zero hue and saturation.
+
+    Returns:
+        An array of tweaked RGB colors.
+    """
+    # hue wraps around so only saturation and value need clipping
+    h = (hsv[:, 0] + hue) % 1
+    s = hsv[:, 1] * saturation
+    np.clip(s, 0, 1, out=s)
+    v = hsv[:, 2] * value
+    np.clip(v, 0, 1, out=v)
+
+    h6 = h * 6
+    sector = h6.astype(int) % 6
+    chroma = v * s
+    x = chroma * (1 - np.abs(h6 % 2 - 1))
+    m = v - chroma
+
+    if out is None:
+        out = np.empty_like(hsv)
+    np.multiply(_CHROMA_TABLE[sector], chroma[:, np.newaxis], out=out)
+    out += _X_TABLE[sector] * x[:, np.newaxis]
+    out += m[:, np.newaxis]
+
+    if hsv_out is not None:
+        gray = chroma == 0
+        hsv_out[:, 0] = np.where(gray, 0, h)
+        hsv_out[:, 1] = np.where(gray, 0, s)
+        hsv_out[:, 2] = v
+    return out
@@ -31,12 +31,28 @@ class TestCookTmap:
         tmap = cook_tmap(cmap_input)
         assert isinstance(tmap, TastyMap)
 
+    def test_cook_from_tmap_cmap_with_alpha(self):
+        cmap = cook_tmap("viridis").cmap.with_alpha(0.5)
+        np.testing.assert_equal(cook_tmap(cmap).cmap_array[:, 3], 0.5)
+
+    def test_cook_from_tmap_cmap_with_gamma(self):
+        cmap = cook_tmap("viridis").cmap.copy()
+        cmap.set_gamma(2.0)
+        np.testing.assert_equal(
+            cook_tmap(cmap).cmap_array, cmap(np.linspace(0, 1, cmap.N))
+        )
+
     def test_cook_from_list(self):
         cmap_input = ["red", "green", "blue"]
         tmap = cook_tmap(cmap_input, num_colors=28)
         assert isinstance(tmap, TastyMap)
         assert len(tmap) == 28
 
+    @pytest.mark.parametrize("cmap_input", [["red"], np.array([[1.0, 0.0, 0.0]])])
+    def test_cook_from_single_color(self, cmap_input):
+        tmap = cook_tmap(cmap_input, from_color_model="rgb")
+        np.testing.assert_equal(tmap.cmap_array, [[1, 0, 0, 1], [1, 0, 0, 1]])
+
     def test_cook_from_list_no_color_model(self):
         cmap_input = [(0.0, 1.0, 1.0), (0.5, 1.0, 1.0), (1.0, 1.0, 1.0)]
         with pytest.raises(ValueError):
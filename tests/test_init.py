@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+import tastymap
+from tastymap.models import TastyMap
+
+
+def test_import_is_lazy():
+    code = "import sys, tastymap; print('matplotlib' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_cook_tmap_skips_pyplot():
+    code = (
+        "import sys, tastymap; tastymap.cook_tmap('viridis', name='pyplot_free'); "
+        "print('matplotlib.pyplot' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.splitlines()[-1] == "False"
+
+
+def test_lazy_attribute():
+    assert tastymap.TastyMap is TastyMap
+    assert "TastyMap" in vars(tastymap)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        tastymap.not_an_attribute
+
+
+def test_core_import_error(monkeypatch):
+    monkeypatch.delitem(vars(tastymap), "cook_tmap", raising=False)
+    monkeypatch.setitem(sys.modules, "tastymap.core", None)
+    with pytest.raises(ImportError):
+        tastymap.cook_tmap
+
+
+def test_optional_import_error(monkeypatch):
+    monkeypatch.delitem(vars(tastymap), "TastyKitchen", raising=False)
+    monkeypatch.setitem(sys.modules, "tastymap.ui", None)
+    with pytest.raises(AttributeError, match="'TastyKitchen' is unavailable"):
+        tastymap.TastyKitchen
+
+
+@pytest.mark.parametrize("name", ["core", "models", "utils"])
+def test_lazy_submodule(name):
+    assert getattr(tastymap, name) is sys.modules[f"tastymap.{name}"]
+
+
+def test_optional_submodule_error(monkeypatch):
+    monkeypatch.delitem(vars(tastymap), "ui", raising=False)
+    monkeypatch.setitem(sys.modules, "tastymap.ui", None)
+    with pytest.raises(AttributeError, match="'ui' is unavailable"):
+        tastymap.ui
+
+
+def test_dir():
+    names = dir(tastymap)
+    assert set(tastymap.__all__) <= set(names)
+    assert {"core", "models", "utils", "ui", "__version__"} <= set(names)
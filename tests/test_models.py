@@ -1,10 +1,19 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
-from matplotlib.colors import BoundaryNorm, LinearSegmentedColormap, Normalize
+from matplotlib import colormaps
+from matplotlib.colors import (
+    BoundaryNorm,
+    LinearSegmentedColormap,
+    Normalize,
+    rgb2hex,
+    rgb_to_hsv,
+)
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 
 from tastymap.models import ColorModel, MatplotlibTastyBar, TastyMap
+from tastymap.utils import get_cmap
 
 
 @pytest.fixture
@@ -18,22 +27,74 @@ class TestTastyMap:
         assert tmap.cmap.name == "testmap"
         assert len(tmap._cmap_array) == 256
 
+    def test_init_copies_cmap(self):
+        cmap = LinearSegmentedColormap.from_list("testmap", ["red", "blue"])
+        assert TastyMap(cmap).cmap is not cmap
+        assert TastyMap._from_cmap(cmap).cmap is cmap
+
     def test_from_str(self):
         tmap = TastyMap.from_str("viridis")
         assert tmap.cmap.name == "viridis"
 
+    def test_from_str_linear_segmented(self):
+        tmap = TastyMap.from_str("coolwarm")
+        assert tmap.cmap.name == "coolwarm"
+        assert isinstance(tmap.cmap, LinearSegmentedColormap)
+        np.testing.assert_equal(
+            tmap._cmap_array, get_cmap("coolwarm")(np.linspace(0, 1, 256))
+        )
+        tmap.cmap.set_bad("red")
+        assert get_cmap("coolwarm").get_bad().tolist() != [1, 0, 0, 1]
+
+    @pytest.mark.filterwarnings("ignore:Overwriting the cmap")
+    @pytest.mark.parametrize("cmap_name", ["coolwarm", "viridis"])
+    @pytest.mark.parametrize("string", ["TestFromStrExtremes", "testfromstrextremes"])
+    def test_from_str_registered_extremes(self, cmap_name, string):
+        cmap = get_cmap(cmap_name).with_extremes(bad="red", under="white", over="black")
+        colormaps.register(cmap, name="TestFromStrExtremes", force=True)
+        tmap = TastyMap.from_str(string)
+        assert tmap.cmap.name == string
+        assert tmap.cmap.get_bad().tolist() == [1.0, 0.0, 0.0, 1.0]
+        assert tmap.cmap.get_under().tolist() == [1.0, 1.0, 1.0, 1.0]
+        assert tmap.cmap.get_over().tolist() == [0.0, 0.0, 0.0, 1.0]
+
     def test_from_list(self):
         colors = ["red", "green", "blue"]
         tmap = TastyMap.from_list(colors)
         assert tmap.cmap.name == "custom_tastymap"
         assert len(tmap._cmap_array) == 3
 
+    def test_from_list_array(self):
+        colors = np.array([[1.0, 0, 0, 1], [0, 0, 1, 1]])
+        tmap = TastyMap.from_list(colors)
+        expected = LinearSegmentedColormap.from_list("expected", colors, N=2)
+        x = np.linspace(0, 1, 100)
+        np.testing.assert_equal(tmap.cmap(x), expected(x))
+        colors[0] = 0
+        np.testing.assert_equal(tmap.cmap(x), expected(x))
+
+    def test_from_list_single_color(self):
+        tmap = TastyMap.from_list([(1.0, 0.0, 0.0)])
+        assert len(tmap) == 1
+        np.testing.assert_equal(tmap.cmap(0.5), (1, 0, 0, 1))
+        np.testing.assert_equal(tmap.reverse().cmap(0.5), (1, 0, 0, 1))
+
     def test_from_list_hsv(self):
         colors = [(0.0, 1.0, 1.0), (0.5, 1.0, 1.0), (1.0, 1.0, 1.0)]
         tmap = TastyMap.from_list(colors, color_model="hsv")
         assert tmap.cmap.name == "custom_tastymap"
         assert len(tmap._cmap_array) == 3
 
+    @pytest.mark.parametrize("color_model", ["HSV", ColorModel.HSV])
+    def test_from_list_hsv_color_model(self, color_model):
+        colors = [(0.0, 1.0, 1.0), (0.5, 1.0, 1.0)]
+        tmap = TastyMap.from_list(colors, color_model=color_model)
+        np.testing.assert_allclose(tmap.cmap_array[:, :3], [[1, 0, 0], [0, 1, 1]])
+
+    def test_from_list_invalid_color_model(self):
+        with pytest.raises(ValueError, match="Invalid color model"):
+            TastyMap.from_list(["red", "blue"], color_model="cmyk")
+
     def test_empty_colormap(self):
         with pytest.raises(ValueError):
             TastyMap.from_list([])
@@ -58,6 +119,32 @@ class TestTastyMap:
         interpolated = tmap.resize(10)
         assert len(interpolated._cmap_array) == 10
 
+    @pytest.mark.parametrize("num_colors", [1, 10, 1000])
+    def test_resize_matches_from_list(self, tmap, num_colors):
+        expected = LinearSegmentedColormap.from_list(
+            "expected", tmap.cmap_array, N=num_colors
+        )
+        resized = tmap.resize(num_colors)
+        assert len(resized) == num_colors
+        assert resized == TastyMap(expected)
+        x = np.linspace(0, 1, 10000)
+        np.testing.assert_equal(resized.cmap(x), expected(x))
+
+    def test_derived_match_from_list(self):
+        tmap = TastyMap.from_str("viridis")
+        colors = tmap.cmap_array
+
+        def from_list(colors):
+            cmap = LinearSegmentedColormap.from_list("x", colors, N=len(colors))
+            return TastyMap(cmap)
+
+        assert tmap[10:20] == from_list(colors[10:20])
+        assert tmap & tmap == from_list(np.concatenate([colors, colors]))
+        assert TastyMap.from_str("Viridis") == tmap
+
+    def test_resize_same_size(self, tmap):
+        assert tmap.resize(256) is tmap
+
     def test_reverse(self, tmap):
         reversed_map = tmap.reverse()
         assert reversed_map._cmap_array[0].tolist() == tmap._cmap_array[-1].tolist()
@@ -72,6 +159,40 @@ class TestTastyMap:
         hex_array = tmap.to_model(ColorModel.HEX)
         assert hex_array.shape == (256,)
 
+    def test_to_hex(self, tmap):
+        hex_array = tmap.to_model(ColorModel.HEX)
+        expected = [rgb2hex(color) for color in tmap._cmap_array[:, :3]]
+        assert hex_array.tolist() == expected
+
+    def test_hex_array_cached(self, tmap):
+        hex_array = tmap.to_model(ColorModel.HEX)
+        assert tmap.to_model("hex") is hex_array
+        assert not hex_array.flags.writeable
+
+    def test_hsv_array_cached(self, tmap):
+        hsv_array = tmap.hsv_array
+        assert tmap.hsv_array is hsv_array
+        assert tmap.to_model(ColorModel.HSV) is hsv_array
+        assert not hsv_array.flags.writeable
+        np.testing.assert_equal(hsv_array, rgb_to_hsv(tmap._cmap_array[:, :3]))
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda tmap: tmap,
+            lambda tmap: tmap.resize(10),
+            lambda tmap: tmap[1:],
+            lambda tmap: tmap.set_extremes(bad="black"),
+            lambda tmap: TastyMap.from_str("viridis"),
+        ],
+    )
+    @pytest.mark.parametrize("color_model", ["rgba", "rgb", "hsv", "hex"])
+    def test_to_model_read_only(self, tmap, build, color_model):
+        array = build(tmap).to_model(color_model)
+        assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            array[0] = array[-1]
+
     def test_set_bad(self, tmap):
         tmap = tmap.set_extremes(bad="black", under="black", over="black")
         assert tmap.cmap.get_bad().tolist() == [0.0, 0.0, 0.0, 1.0]
@@ -87,6 +208,9 @@ class TestTastyMap:
         tmap2 = TastyMap(cmap2)
         combined = tmap & tmap2
         assert len(combined._cmap_array) == 256 + 256
+        assert combined.cmap.name == "testmap_testmap2"
+        np.testing.assert_allclose(combined._cmap_array[:256], tmap._cmap_array)
+        np.testing.assert_allclose(combined._cmap_array[256:], tmap2._cmap_array)
 
     def test_len(self, tmap):
         assert len(tmap) == 256
@@ -111,6 +235,10 @@ class TestTastyMap:
         with pytest.raises(TypeError):
             tmap["not_an_index"]
 
+    def test_color_model_str(self, tmap):
+        np.testing.assert_equal(tmap.to_model("HEX"), tmap.to_model(ColorModel.HEX))
+        assert tmap.to_model("rgba") is tmap.to_model(ColorModel.RGBA)
+
     def test_invalid_color_model(self, tmap):
         with pytest.raises(ValueError):
             tmap.to_model("not_a_real_color_model")
@@ -131,6 +259,14 @@ class TestTastyMap:
         tweaked = tmap.tweak_hsv(hue=50, saturation=5, value=2)
         assert isinstance(tweaked, TastyMap)
 
+    def test_tweak_seeds_hsv_array(self, tmap):
+        tweaked = tmap.tweak_hsv(hue=50, saturation=0.5)
+        np.testing.assert_allclose(
+            tweaked.hsv_array, rgb_to_hsv(tweaked._cmap_array[:, :3]), atol=1e-12
+        )
+        desaturated = tmap.tweak_hsv(saturation=0)
+        np.testing.assert_equal(desaturated.hsv_array[:, :2], 0)
+
     def test_tweak_edge_values(self, tmap):
         tweaked_min_hue = tmap.tweak_hsv(hue=-255)
         tweaked_max_hue = tmap.tweak_hsv(hue=255)
@@ -195,11 +331,26 @@ class TestTastyMap:
         tmap = TastyMap.from_str("viridis")
         assert not (tmap == "some_string")
 
+    def test_eq_operator_different_lengths(self):
+        tmap = TastyMap.from_str("viridis")
+        assert tmap == tmap
+        assert not (tmap == tmap.resize(10))
+
     def test_or_operator(self):
         tmap = TastyMap.from_str("viridis")
         result = tmap | 10
         assert len(result) == 10
 
+    @pytest.mark.filterwarnings("ignore:Overwriting the cmap")
+    def test_register_after_overwrite(self):
+        tmap = TastyMap.from_str("viridis")
+        tmap.register("test_register_after_overwrite")
+        other = TastyMap.from_str("magma").cmap
+        colormaps.register(other, name="test_register_after_overwrite", force=True)
+        tmap.register("test_register_after_overwrite")
+        registered = TastyMap(colormaps["test_register_after_overwrite"])
+        assert registered == tmap
+
     def test_lshift_operator(self):
         tmap = TastyMap.from_str("viridis")
         result = tmap << "new_name"
@@ -232,6 +383,40 @@ class TestTastyMap:
         for color in tmap:
             assert isinstance(color, np.ndarray)
 
+    def test_cmap_array(self):
+        tmap = TastyMap.from_str("viridis")
+        assert tmap.cmap_array is tmap._cmap_array
+        for color in tmap:
+            assert np.shares_memory(color, tmap.cmap_array)
+
+    def test_cmap_array_lazy(self):
+        tmap = TastyMap.from_list(["red", "green", "blue"])
+        renamed = tmap.rename("rgb")
+        renamed.register(echo=False)
+        assert "_cmap_array" not in tmap.__dict__
+        assert "_cmap_array" not in renamed.__dict__
+        assert len(renamed) == 3
+        np.testing.assert_equal(renamed.cmap_array, tmap.cmap_array)
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda tmap: TastyMap.from_str("viridis"),
+            lambda tmap: tmap.reverse(),
+            lambda tmap: tmap[10:20],
+            lambda tmap: tmap.resize(10),
+            lambda tmap: tmap.tweak_hsv(hue=10),
+            lambda tmap: tmap & tmap,
+            lambda tmap: tmap.set_extremes(bad="black"),
+        ],
+    )
+    def test_cmap_array_matches_cmap(self, build):
+        tmap = TastyMap.from_str("coolwarm")
+        tmap.cmap_array
+        result = build(tmap)
+        expected = result.cmap.copy()(np.linspace(0, 1, len(result)))
+        np.testing.assert_equal(result.cmap_array, expected)
+
     def test_resize_with_extremes(self):
         tmap = TastyMap.from_str("viridis")
         result = tmap.set_extremes(bad="black", under="black", over="black").resize(10)
@@ -239,6 +424,40 @@ class TestTastyMap:
         assert result.cmap.get_over().tolist() == [0.0, 0.0, 0.0, 1.0]
         assert result.cmap.get_under().tolist() == [0.0, 0.0, 0.0, 1.0]
 
+    @pytest.mark.filterwarnings("error")
+    def test_extremes_without_deprecated_calls(self):
+        tmap = TastyMap.from_str("viridis").set_extremes(bad="black", over="white")
+        result = tmap.tweak_hsv(hue=10).resize(10)
+        assert result.cmap.get_bad().tolist() == [0.0, 0.0, 0.0, 1.0]
+        assert result.cmap.get_over().tolist() == [1.0, 1.0, 1.0, 1.0]
+
+    @pytest.mark.parametrize(
+        "derive",
+        [
+            lambda tmap: tmap.resize(10),
+            lambda tmap: tmap.tweak_hsv(value=0.5),
+            lambda tmap: tmap & tmap,
+        ],
+    )
+    def test_derive_mutated_extremes(self, derive):
+        tmap = TastyMap.from_str("coolwarm")
+        derive(tmap)
+        tmap.cmap.set_bad("red")
+        assert derive(tmap).cmap.get_bad().tolist() == [1.0, 0.0, 0.0, 1.0]
+
+    def test_tweak_cmap_extremes(self):
+        cmap = get_cmap("coolwarm").with_extremes(bad="black", under="white")
+        tmap = TastyMap(cmap).tweak_hsv(value=0.5)
+        assert tmap.cmap.get_bad().tolist() == [0.0, 0.0, 0.0, 1.0]
+        assert tmap.cmap.get_under().tolist() == [1.0, 1.0, 1.0, 1.0]
+        np.testing.assert_equal(tmap.cmap.get_over(), cmap.get_over())
+
+    def test_tweak_end_color_extremes(self):
+        tmap = TastyMap.from_str("coolwarm")
+        over = tuple(tmap.cmap_array[-1])
+        tweaked = tmap.set_extremes(over=over).tweak_hsv(value=0.5)
+        assert tuple(tweaked.cmap.get_over()) == over
+
 
 class TestMatplotlibTastyBar:
     @pytest.fixture
@@ -254,6 +473,14 @@ class TestMatplotlibTastyBar:
         assert not tmap_bar.norm.clip
         assert tmap_bar.norm.extend == "both"
 
+    def test_init_unsorted_ticks(self, tmap):
+        tmap_bar = MatplotlibTastyBar(tmap, bounds=[18, 0, 4])
+        np.testing.assert_equal(tmap_bar.ticks, [0, 4, 18])
+
+    def test_init_step_ticks(self, tmap):
+        tmap_bar = MatplotlibTastyBar(tmap, bounds=slice(0, 0.2, 0.1), center=False)
+        np.testing.assert_allclose(tmap_bar.ticks, [0, 0.1, 0.2])
+
     def test_init_provided_ticks_and_center(self, tmap):
         tmap_bar = MatplotlibTastyBar(tmap, bounds=[0, 4, 18], center=True)
         np.testing.assert_equal(tmap_bar.ticks, [0, 2.5, 11.5])
@@ -262,6 +489,11 @@ class TestMatplotlibTastyBar:
         assert not tmap_bar.norm.clip
         assert tmap_bar.norm.extend == "both"
 
+    def test_format_labels(self, tmap):
+        tmap_bar = MatplotlibTastyBar(tmap, bounds=[0, 4, 18], labels=["a", "b"])
+        assert tmap_bar.format(0, 1) == "b"
+        assert tmap_bar.format(0, 2) == ""
+
     def test_init_not_provided_ticks(self, tmap):
         tmap_bar = MatplotlibTastyBar(tmap, bounds=slice(0, 18, 4))
         assert tmap_bar.ticks is None
@@ -303,3 +535,10 @@ class TestMatplotlibTastyBar:
         tmap_bar = MatplotlibTastyBar(tmap, bounds=[0, 4, 18])
         tmap_bar.add_to(img)
         assert len(fig.axes) == 2
+
+    def test_add_to_non_pyplot_figure(self, tmap):
+        fig = Figure()
+        img = fig.subplots().imshow(np.random.rand(10, 10))
+        tmap_bar = MatplotlibTastyBar(tmap, bounds=[0, 4, 18])
+        tmap_bar.add_to(img)
+        assert len(fig.axes) == 2
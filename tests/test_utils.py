@@ -1,8 +1,22 @@
 import numpy as np
 import pytest
-from matplotlib.colors import LinearSegmentedColormap, ListedColormap
-
-from tastymap.utils import cmap_to_array, get_cmap, replace_match, subset_cmap
+from matplotlib.colors import (
+    LinearSegmentedColormap,
+    ListedColormap,
+    hsv_to_rgb,
+    rgb_to_hsv,
+)
+
+from tastymap import utils
+from tastymap.utils import (
+    array_to_cmap,
+    cmap_to_array,
+    get_cmap,
+    replace_match,
+    resample_array,
+    subset_cmap,
+    tweak_hsv_to_rgb,
+)
 
 
 class TestGetmap:
@@ -10,6 +24,11 @@ class TestGetmap:
         cmap = get_cmap("viridis")
         assert isinstance(cmap, ListedColormap)
 
+    def test_returns_copy(self):
+        cmap = get_cmap("viridis")
+        cmap.set_bad("red")
+        assert get_cmap("viridis").get_bad().tolist() != [1, 0, 0, 1]
+
     def test_invalid(self):
         with pytest.raises(ValueError, match="Unknown colormap 'invalid_cmap'."):
             get_cmap("invalid_cmap")
@@ -111,6 +130,78 @@ class TestmapToArray:
         arr = cmap_to_array(["red", "green", "blue"])
         assert isinstance(arr, np.ndarray)
 
+    def test_from_array(self):
+        colors = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        assert cmap_to_array(colors) is colors
+
+    def test_modified_copies(self):
+        cmap = array_to_cmap("testing", cmap_to_array("viridis"))
+        cmap_to_array(cmap)
+        assert cmap_to_array(cmap.with_alpha(0.5))[0, 3] == 0.5
+        gamma_cmap = cmap.copy()
+        gamma_cmap.set_gamma(2.0)
+        np.testing.assert_equal(
+            cmap_to_array(gamma_cmap), gamma_cmap(np.linspace(0, 1, gamma_cmap.N))
+        )
+        assert not np.array_equal(cmap_to_array(gamma_cmap), cmap_to_array(cmap))
+
+
+class TestArrayToCmap:
+    def test_matches_from_list(self):
+        cmap_array = cmap_to_array("coolwarm")
+        cmap = array_to_cmap("test", cmap_array)
+        expected = LinearSegmentedColormap.from_list(
+            "test", cmap_array, N=len(cmap_array)
+        )
+        assert cmap.name == "test"
+        assert cmap.N == len(cmap_array)
+        x = np.linspace(0, 1, 1000)
+        np.testing.assert_equal(cmap(x), expected(x))
+
+    @pytest.mark.parametrize("num_colors", [1, 10, 1000])
+    def test_num_colors(self, num_colors):
+        cmap_array = cmap_to_array("coolwarm")
+        cmap = array_to_cmap("test", cmap_array, num_colors)
+        expected = LinearSegmentedColormap.from_list("test", cmap_array, N=num_colors)
+        assert cmap.N == num_colors
+        x = np.linspace(0, 1, 1000)
+        np.testing.assert_equal(cmap(x), expected(x))
+
+    def test_colors(self):
+        cmap = array_to_cmap("test", np.array(["red", "blue"]))
+        np.testing.assert_equal(cmap_to_array(cmap), [[1, 0, 0, 1], [0, 0, 1, 1]])
+
+    def test_rgb(self):
+        cmap = array_to_cmap("test", np.array([[1.0, 0, 0], [0, 0, 1]]))
+        np.testing.assert_equal(cmap_to_array(cmap), [[1, 0, 0, 1], [0, 0, 1, 1]])
+
+    @pytest.mark.parametrize(
+        "cmap_array", [np.array([[1.0, 0, 0]]), np.array([[1.0, 0, 0, 1]]), ["red"]]
+    )
+    def test_single_color(self, cmap_array):
+        cmap = array_to_cmap("test", np.asarray(cmap_array))
+        assert cmap.N == 1
+        np.testing.assert_equal(cmap(0.5), (1, 0, 0, 1))
+        assert cmap._repr_html_()
+
+    def test_out_of_range(self):
+        with pytest.raises(ValueError):
+            array_to_cmap("test", np.array([[2.0, 0, 0], [0, 0, 1]]))
+
+
+class TestResampleArray:
+    @pytest.mark.parametrize("num_colors", [1, 2, 10, 255, 256, 1000])
+    def test_matches_from_list(self, num_colors):
+        cmap_array = cmap_to_array("coolwarm")
+        expected = LinearSegmentedColormap.from_list("test", cmap_array, N=num_colors)
+        np.testing.assert_equal(
+            resample_array(cmap_array, num_colors), cmap_to_array(expected)
+        )
+
+    def test_single_color(self):
+        cmap_array = np.array([[1.0, 0, 0, 1]])
+        np.testing.assert_equal(resample_array(cmap_array, 3), [[1, 0, 0, 1]] * 3)
+
 
 class TestReplaceMatch:
     def test_single_match(self):
@@ -156,3 +247,50 @@ class TestReplaceMatch:
     def test_non_string_input(self):
         with pytest.raises(TypeError):
             replace_match(r"\d+", 123, "number")
+
+
+class TestRgbToHsv:
+    def test_matches_matplotlib(self):
+        rgb = np.random.default_rng(0).random((1000, 3))
+        rgb[::7] = 0.5
+        rgb[::5, 1] = rgb[::5, 2]
+        rgb[::3, 0] = rgb[::3, 1]
+        np.testing.assert_equal(utils.rgb_to_hsv(rgb), rgb_to_hsv(rgb))
+
+    def test_gray(self):
+        rgb = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [1.0, 1.0, 1.0]])
+        np.testing.assert_equal(utils.rgb_to_hsv(rgb)[:, :2], 0)
+
+
+class TestTweakHsvToRgb:
+    @pytest.fixture
+    def rgb(self):
+        return cmap_to_array("turbo")[:, :3]
+
+    def test_identity(self, rgb):
+        np.testing.assert_allclose(tweak_hsv_to_rgb(rgb_to_hsv(rgb)), rgb, atol=1e-12)
+
+    def test_gray(self):
+        rgb = np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.5], [1.0, 1.0, 1.0]])
+        np.testing.assert_allclose(tweak_hsv_to_rgb(rgb_to_hsv(rgb), hue=0.3), rgb)
+
+    @pytest.mark.parametrize(
+        "hue, saturation, value",
+        [(0.2, 1, 1), (-0.7, 1, 1), (0, 2, 1), (0.5, 0.5, 1.5)],
+    )
+    def test_matches_matplotlib(self, rgb, hue, saturation, value):
+        hsv = rgb_to_hsv(rgb)
+        hsv[:, 0] = (hsv[:, 0] + hue) % 1
+        hsv[:, 1] *= saturation
+        hsv[:, 2] *= value
+        expected = hsv_to_rgb(np.clip(hsv, 0, 1))
+        tweaked = tweak_hsv_to_rgb(
+            rgb_to_hsv(rgb), hue=hue, saturation=saturation, value=value
+        )
+        np.testing.assert_allclose(tweaked, expected, atol=1e-12)
+
+    def test_out(self, rgb):
+        out = np.empty((len(rgb), 4))
+        tweaked = tweak_hsv_to_rgb(rgb_to_hsv(rgb), hue=0.2, out=out[:, :3])
+        assert np.shares_memory(tweaked, out)
+        np.testing.assert_equal(out[:, :3], tweak_hsv_to_rgb(rgb_to_hsv(rgb), hue=0.2))